@@ -36,6 +36,16 @@ CORS(app, resources={r"/*": {"origins": [
 app.config['CORS_HEADERS'] = 'Content-Type'
 app.config['APPLICATION_ROOT'] = default_prefix
 
+# for psycopg3 you need to use it with postgresql+psycopg manner, simple postgresql will use only psycopg2
+conn_string = f"postgresql+psycopg://segmentmaster:segment@{host_ip}:5434/segmentationdb"
+
+# Built once here instead of re-formatting the same DSN inside every handler
+pg_dsn = f"dbname='segmentationdb' user='segmentmaster' host='{host_ip}' port='5434' password='segment'"
+
+# Single engine shared by all requests, so connections come from its pool
+# instead of a fresh engine (and pool) being built per call
+db = create_engine(conn_string)
+
 @app.route('/')
 @cross_origin()
 def index():
@@ -43,7 +53,7 @@ def index():
 
 @app.route('/getSegmentationCustomers', methods=['GET'])
 def getSegmentationCustomers(pg=pg):
-    connection = pg.connect(f"dbname='segmentationdb' user='segmentmaster' host='{host_ip}' port='5434' password='segment'")
+    connection = pg.connect(pg_dsn)
     data_df = pd.read_sql('select * from test', connection)
     return data_df.to_json(orient='records')
 
@@ -76,7 +86,7 @@ def getMLInfo(pg=pg):
         os.system("python3 segmentation_process.py")
 
     # 3. read segment results: Connect to db and read latest segmentation results
-    connection = pg.connect(f"dbname='segmentationdb' user='segmentmaster' host='{host_ip}' port='5434' password='segment'")
+    connection = pg.connect(pg_dsn)
     data_df = pd.read_sql('select * from mlinfo', connection)
     #print(data_df['image2'][0])
     encoded_img2 = base64.b64encode(data_df['image2'][0]).decode("utf-8")
@@ -95,10 +105,6 @@ def getMLInfo(pg=pg):
 def addCustomer(pg=pg):
     data = request.json
 
-    # for psycopg3 you need to use it with postgresql+psycopg manner, simple postgresql will use only psycopg2
-    conn_string = f"postgresql+psycopg://segmentmaster:segment@{host_ip}:5434/segmentationdb"
-
-    db = create_engine(conn_string)
     connection = db.connect()
 
     # our dataframe
@@ -109,7 +115,9 @@ def addCustomer(pg=pg):
     print(df)
     #connection.execute(text("SELECT setval(pg_get_serial_sequence('test', 'id'), (SELECT MAX(id) FROM test)+1);"))
     df.to_sql('test', con=connection, if_exists='append', index=False)
-    connection = pg.connect(f"dbname='segmentationdb' user='segmentmaster' host='{host_ip}' port='5434' password='segment'")
+    # Return the pooled connection instead of abandoning it
+    connection.close()
+    connection = pg.connect(pg_dsn)
     connection.autocommit = True
     connection.close()
 
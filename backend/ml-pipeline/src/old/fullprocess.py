@@ -18,6 +18,9 @@ logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
 host_ip = os.getenv('DOCKER_HOST_IP', 'localhost')
 
+# Compiled once at module load instead of re.findall re-parsing the pattern per run
+score_pattern = re.compile(r'\d*\.?\d+')
+
 def main():
 
     ###  1. see if API trigger mode with DB or command line mode with csv
@@ -62,7 +65,7 @@ def main():
     # Check whether the score from the deployed model is different from the
     # score from the model that uses the newest ingested data
     with open(os.path.join(PROD_DEPLOYMENT_PATH, "latestscore.txt")) as file:
-        deployed_score = re.findall(r'\d*\.?\d+', file.read())[0]
+        deployed_score = score_pattern.findall(file.read())[0]
         deployed_score = float(deployed_score)
 
     data_df.pop('id')